@@ -1,242 +1,798 @@
+from __future__ import annotations
+
 import sys
+import asyncio
 import os
 from dotenv import load_dotenv
-from crewai import Agent, Task, Crew
-from langchain_openai import ChatOpenAI
-from docx import Document
-import json
-from typing import List, Dict, Any
+import io
+import gc
+import orjson
+import tempfile
+import shutil
+import hashlib
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Tuple
 import logging
 from datetime import datetime
 
+# CrewAI, LangChain/OpenAI and python-docx take seconds to import; they are
+# loaded where first used so short runs and cached results start fast
+if TYPE_CHECKING:
+    import httpx
+    import openai
+    from crewai import Agent, Crew, Task
+    from langchain_openai import ChatOpenAI
+
+# Load environment variables
+load_dotenv()
+
+# Console output from agents, crews and logging is opt-in
+VERBOSE = os.getenv('TCG_VERBOSE', '0') == '1'
+
 # Set up logging
+log_handlers: List[logging.Handler] = [logging.FileHandler('test_generation.log')]
+if VERBOSE:
+    log_handlers.append(logging.StreamHandler())
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('test_generation.log'),
-        logging.StreamHandler()
-    ]
+    handlers=log_handlers
 )
 
-# Load environment variables
-load_dotenv()
-
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 if not OPENAI_API_KEY:
     raise ValueError("OPENAI_API_KEY is missing. Ensure it is set in the environment or .env file.")
 
+LLM_CACHE_MODE = os.getenv('LC_CACHE_MODE', 'exact')
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('LC_CACHE_SIMILARITY', '0.95'))
+SEMANTIC_CACHE_TTL = int(os.getenv('LC_CACHE_TTL', str(7 * 24 * 3600)))
+SEMANTIC_CACHE_DIR = '.gptcache'
+# Roughly the 512-token window of the ONNX embedding model; longer documents
+# are only ever matched exactly, so semantic mode chunks at this size too
+SEMANTIC_CACHE_MAX_CHARS = 2000
+
+# Per-document input is wrapped in these markers so the semantic cache can
+# tell it apart from the static instructions around it
+DOCUMENT_OPEN = "<document>"
+DOCUMENT_CLOSE = "</document>"
+
+def _semantic_cache_key(data: Dict[str, Any], **_: Any) -> Tuple[str, str]:
+    """Split a prompt into an exact-match digest and the text to embed.
+
+    Only the document between the markers is embedded: the surrounding
+    instructions are the same for every document and would make all of them
+    look alike. Everything else, and any document too long to embed in full,
+    goes into the digest, which must match exactly for a cache hit.
+    """
+    prompt = data.get('prompt') or ''
+    start = prompt.find(DOCUMENT_OPEN)
+    end = prompt.rfind(DOCUMENT_CLOSE)
+    if start == -1 or end < start:
+        # No document (later tasks): exact match on the whole prompt
+        return hashlib.sha256(prompt.encode()).hexdigest(), prompt[-SEMANTIC_CACHE_MAX_CHARS:]
+
+    document = prompt[start + len(DOCUMENT_OPEN):end].strip()
+    surroundings = prompt[:start] + prompt[end:]
+    if len(document) > SEMANTIC_CACHE_MAX_CHARS:
+        surroundings += document
+    digest = hashlib.sha256(surroundings.encode()).hexdigest()
+    return digest, document[:SEMANTIC_CACHE_MAX_CHARS]
+
+class _ContentHashEvaluation:
+    """Similarity evaluation that only scores entries whose digests match."""
+
+    def __init__(self, delegate: Any):
+        self.delegate = delegate
+
+    def evaluation(self, src_dict: Dict[str, Any], cache_dict: Dict[str, Any], **kwargs: Any) -> float:
+        if src_dict['question'] != cache_dict['question']:
+            return self.delegate.range()[0]
+        return self.delegate.evaluation(src_dict, cache_dict, **kwargs)
+
+    def range(self) -> Tuple[float, float]:
+        return self.delegate.range()
+
+def _prune_gptcache(llm_hash: str, ttl_bucket: int) -> None:
+    """Remove this LLM configuration's cache directories from expired TTL buckets."""
+    if not os.path.isdir(SEMANTIC_CACHE_DIR):
+        return
+    for name in os.listdir(SEMANTIC_CACHE_DIR):
+        prefix, _, bucket = name.rpartition('_')
+        if prefix == llm_hash and bucket.isdigit() and int(bucket) < ttl_bucket:
+            shutil.rmtree(os.path.join(SEMANTIC_CACHE_DIR, name), ignore_errors=True)
+
+def _init_gptcache(cache_obj: Any, llm_string: str) -> None:
+    """Initialize a GPTCache instance for one LLM configuration.
+
+    Cached entries are partitioned by a hash of the LLM configuration, so a
+    model or temperature change never serves stale answers, and by a TTL
+    bucket, so the whole semantic cache rolls over every LC_CACHE_TTL seconds.
+    Within a partition, a hit needs the same instructions and context
+    (content hash) and a semantically similar document.
+    """
+    from gptcache.adapter.api import init_similar_cache
+    from gptcache.config import Config
+    from gptcache.embedding import Onnx
+    from gptcache.manager import manager_factory
+    from gptcache.similarity_evaluation import SearchDistanceEvaluation
+
+    llm_hash = hashlib.sha256(llm_string.encode()).hexdigest()[:16]
+    ttl_bucket = int(time.time() // SEMANTIC_CACHE_TTL)
+    _prune_gptcache(llm_hash, ttl_bucket)
+    onnx = Onnx()
+    data_manager = manager_factory(
+        "sqlite,faiss",
+        data_dir=os.path.join(SEMANTIC_CACHE_DIR, f"{llm_hash}_{ttl_bucket}"),
+        vector_params={"dimension": onnx.dimension}
+    )
+    init_similar_cache(
+        cache_obj=cache_obj,
+        pre_func=_semantic_cache_key,
+        embedding=onnx,
+        data_manager=data_manager,
+        evaluation=_ContentHashEvaluation(SearchDistanceEvaluation()),
+        config=Config(similarity_threshold=SEMANTIC_CACHE_THRESHOLD)
+    )
+
+def _configure_llm_cache() -> None:
+    """Install a process-wide LangChain LLM cache so repeated prompts skip the API."""
+    from langchain_core.globals import get_llm_cache, set_llm_cache
+    if get_llm_cache() is not None:
+        return
+    redis_url = os.getenv('LC_CACHE_REDIS_URL')
+    if LLM_CACHE_MODE == 'semantic':
+        # Near-duplicate requirements docs hit on embedding similarity
+        from langchain_community.cache import GPTCache
+        set_llm_cache(GPTCache(_init_gptcache))
+        logging.info(f"LLM cache: semantic (threshold {SEMANTIC_CACHE_THRESHOLD})")
+    elif redis_url:
+        # Shared cache for multi-process server deployments
+        import redis
+        from langchain_community.cache import RedisCache
+        set_llm_cache(RedisCache(redis.Redis.from_url(redis_url)))
+        logging.info("LLM cache: Redis")
+    else:
+        from langchain_community.cache import SQLiteCache
+        database_path = os.getenv('LC_CACHE_DB', '.langchain_cache.db')
+        set_llm_cache(SQLiteCache(database_path=database_path))
+        logging.info(f"LLM cache: SQLite ({database_path})")
+
+HEAVY_MODEL = "gpt-4-turbo"
+LIGHT_MODEL = os.getenv('TCG_LIGHT_MODEL', 'gpt-4o-mini')
+# Keep low and fixed: prompt and response caching rely on deterministic calls
+LLM_TEMPERATURE = 0.1
+# Rate limits (429) and transient errors are retried with exponential backoff
+LLM_MAX_RETRIES = 6
+LLM_REQUEST_TIMEOUT = 90
+# Crew runs that still fail are resumed from the first unfinished task
+CREW_REPLAY_ATTEMPTS = 2
+
+# Agent profiles are module constants so the prompt prefix is byte-identical
+# across runs and can be served from the provider's prompt cache
+REQUIREMENTS_ANALYST = {
+    'role': 'Requirements Analyst',
+    'goal': 'Extract structured, testable information from software requirements',
+    'backstory': 'Senior requirements analyst; spots edge cases, NFRs and hidden constraints.'
+}
+TEST_CASE_ENGINEER = {
+    'role': 'Test Case Engineer',
+    'goal': 'Write test cases covering every requirement',
+    'backstory': 'Senior test engineer; writes clear, complete, edge-case-aware test cases.'
+}
+TEST_DATA_ENGINEER = {
+    'role': 'Test Data Engineer',
+    'goal': 'Produce test data sets for every test scenario',
+    'backstory': 'Test data engineer; knows data patterns, boundaries and security-relevant inputs.'
+}
+TEST_CASE_VALIDATOR = {
+    'role': 'Test Case Validator',
+    'goal': 'Check test suite coverage and quality; find gaps',
+    'backstory': 'Test suite reviewer; finds coverage gaps and redundant cases.'
+}
+
+# Task prompts; the templates are filled with str.format(). Static instructions
+# come first and the per-document input last, keeping the prompt prefix cacheable.
+ANALYZE_CHUNK_TEMPLATE = (
+    "Task: analyze one chunk of a larger requirements document for test design.\n"
+    "Extract: functional reqs; non-functional reqs; business rules/constraints; "
+    "user workflows; interfaces/dependencies; performance; security; "
+    "edge cases/boundaries.\n"
+    "Output: structured markdown, one section per item; omit empty sections.\n\n"
+    "Requirements chunk {number}:\n" + DOCUMENT_OPEN + "\n{chunk}\n" + DOCUMENT_CLOSE
+)
+ANALYZE_FUNCTIONAL_TEMPLATE = (
+    "Task: analyze for test design.\n"
+    "Extract: functional reqs; business rules/constraints; user workflows; "
+    "interfaces/dependencies; edge cases/boundaries.\n"
+    "Output: structured markdown, one section per item.\n\n"
+    "{analysis_input}"
+)
+ANALYZE_NON_FUNCTIONAL_TEMPLATE = (
+    "Task: analyze for test design.\n"
+    "Extract: non-functional reqs; performance; security.\n"
+    "Output: structured markdown, one section per item.\n\n"
+    "{analysis_input}"
+)
+GENERATE_TEST_CASES_PROMPT = (
+    "Task: write test cases from the requirements analysis.\n"
+    "Cover: functional; non-functional; edge/boundary; errors; integration; "
+    "security; performance.\n"
+    "Fields per case: id, title, requirement ref, preconditions, steps, "
+    "expected result, test data ref, priority, type, notes/risks."
+)
+GENERATE_TEST_DATA_PROMPT = (
+    "Task: produce test data for every test case.\n"
+    "Cover: happy path; boundary values; invalid inputs; edge cases; "
+    "security; performance.\n"
+    "Output: JSON list; fields per entry: test_case_id, inputs, expected, "
+    "dependencies, environment."
+)
+VALIDATE_TEST_CASES_PROMPT = (
+    "Task: review the test suite and its data.\n"
+    "Assess: requirements coverage; case quality; redundancy; risk.\n"
+    "Report: coverage metrics, quality metrics, optimizations, risks, improvements."
+)
+
+# Non-interactive runs (CI, nightly jobs) go through the cheaper OpenAI Batch API
+BATCH_MODE = os.getenv('TCG_MODE') == 'batch'
+BATCH_POLL_INTERVAL = int(os.getenv('TCG_BATCH_POLL_INTERVAL', '30'))
+
+# Documents longer than one chunk are analyzed map-reduce style. With the
+# semantic cache, chunks must fit its embedding window for near-duplicate
+# documents to hit chunk by chunk; the merge prompt then matches exactly.
+ANALYSIS_CHUNK_SIZE = SEMANTIC_CACHE_MAX_CHARS if LLM_CACHE_MODE == 'semantic' else 4000
+ANALYSIS_CHUNK_OVERLAP = 200
+ANALYSIS_CONCURRENCY = 5
+
+# One connection pool per process, shared by every crew and agent
+HTTP_MAX_CONNECTIONS = 50
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_TIMEOUT = 60
+
+@lru_cache(maxsize=None)
+def _shared_http_client() -> httpx.Client:
+    """Build the process-wide HTTP client on first use."""
+    import importlib.util
+    import httpx
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+    )
+    # HTTP/2 needs the optional h2 package (httpx[http2])
+    http2 = importlib.util.find_spec('h2') is not None
+    return httpx.Client(limits=limits, http2=http2, timeout=HTTP_TIMEOUT)
+
+# Report sections and the staged task outputs they are assembled from
+RESULT_SECTIONS = {
+    'requirements_analysis': ('functional_requirements_analysis.md', 'non_functional_requirements_analysis.md'),
+    'test_cases': ('detailed_test_cases.md',),
+    'test_data': ('test_data_sets.json',),
+    'validation_report': ('validation_report.md',)
+}
+
+# Whole-pipeline results are cached by document content. MODEL_VERSION and
+# PROMPT_VERSION are part of the key: bump PROMPT_VERSION on any prompt edit.
+RESULT_CACHE_DIR = os.getenv('TCG_RESULT_CACHE_DIR', 'cache')
+MODEL_VERSION = f"{HEAVY_MODEL}+{LIGHT_MODEL}"
+PROMPT_VERSION = "3"
+
+# Documents processed at once by a batch run
+MAX_CONCURRENCY = int(os.getenv('TCG_MAX_CONCURRENCY', '10'))
+
+# Tokens per paragraph when a streamed response has no line breaks
+STREAM_PARAGRAPH_TOKENS = 200
+_STREAM_END = object()
+
+@lru_cache(maxsize=None)
+def _token_queue_handler_class() -> type:
+    """Define the streaming callback handler once langchain_core is first needed."""
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class TokenQueueCallbackHandler(BaseCallbackHandler):
+        """Forward streamed LLM tokens onto a queue for incremental export."""
+
+        def __init__(self, token_queue: queue.Queue):
+            self.token_queue = token_queue
+
+        # Concurrent tasks share the queue, so every token is tagged with its run
+
+        def on_llm_new_token(self, token: str, *, run_id: Any, **kwargs: Any) -> None:
+            self.token_queue.put((run_id, token))
+
+        def on_llm_end(self, response: Any, *, run_id: Any, **kwargs: Any) -> None:
+            self.token_queue.put((run_id, None))
+
+        def on_llm_error(self, error: BaseException, *, run_id: Any, **kwargs: Any) -> None:
+            self.token_queue.put((run_id, None))
+
+    return TokenQueueCallbackHandler
+
 class TestCaseGenerationCrew:
     def __init__(self, requirements_text: str):
         """Initialize the Test Case Generation Crew using GPT as the LLM."""
         self.requirements_text = requirements_text
-        self.llm = ChatOpenAI(
-            api_key=OPENAI_API_KEY,
-            model="gpt-4-turbo",
-            temperature=0.1
-        )
+        _configure_llm_cache()
+        self.token_queue: queue.Queue = queue.Queue()
+        # Frontier model for analysis and test design, cheaper one for expansion and review
+        self.llm_heavy = self._create_llm(HEAVY_MODEL)
+        self.llm_light = self._create_llm(LIGHT_MODEL)
         self.output_dir = self._create_output_directory()
+        # Artifacts are written here first and moved into output_dir at the end;
+        # created when a run starts
+        self.staging_dir: Optional[str] = None
+        # Per-chunk analyses of a large document, filled in by the map phase
+        self.chunk_analyses: Optional[List[str]] = None
         logging.info("TestCaseGenerationCrew initialized")
 
+    def _create_llm(self, model: str) -> ChatOpenAI:
+        """Create a streaming chat model bound to this crew's token queue."""
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(
+            api_key=OPENAI_API_KEY,
+            model=model,
+            temperature=LLM_TEMPERATURE,
+            max_retries=LLM_MAX_RETRIES,
+            request_timeout=LLM_REQUEST_TIMEOUT,
+            streaming=True,
+            callbacks=[_token_queue_handler_class()(self.token_queue)],
+            http_client=_shared_http_client()
+        )
+
     def _create_output_directory(self) -> str:
         """Create a timestamped output directory for artifacts."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
         output_dir = f"test_artifacts_{timestamp}"
         os.makedirs(output_dir, exist_ok=True)
         return output_dir
 
-    def create_requirements_analyzer(self) -> Agent:
-        """Create the Requirements Analyzer agent."""
-        return Agent(
-            role='Requirements Analyst',
-            goal='Analyze software requirements and extract structured information for test case creation',
-            backstory='''You are a senior Requirements Analyst with 15+ years of experience in 
-            analyzing complex software requirements. You excel at identifying edge cases, 
-            non-functional requirements, and hidden constraints.''',
-            verbose=True,
-            llm=self.llm
+    def _create_staging_directory(self) -> str:
+        """Create a hidden staging directory next to the output directory.
+
+        The path is kept relative: CrewAI strips a leading '/' from
+        output_file, so an absolute path would be written elsewhere.
+        """
+        return os.path.relpath(tempfile.mkdtemp(prefix='.staging_', dir='.'))
+
+    def _promote_artifacts(self) -> None:
+        """Atomically move every staged artifact into the output directory."""
+        if self.staging_dir is None:
+            return
+        for name in os.listdir(self.staging_dir):
+            os.replace(os.path.join(self.staging_dir, name), os.path.join(self.output_dir, name))
+        os.rmdir(self.staging_dir)
+        self.staging_dir = None
+
+    def _create_agent(self, profile: Dict[str, str], llm: ChatOpenAI) -> Agent:
+        """Create an agent from one of the module-level profiles."""
+        from crewai import Agent
+        agent = Agent(
+            **profile,
+            verbose=VERBOSE,
+            llm=llm
         )
+        if agent.llm is not llm:
+            logging.warning(
+                "CrewAI replaced the ChatOpenAI instance; streaming, the LLM cache and the "
+                "shared HTTP client are bypassed. Install the versions in requirements.txt."
+            )
+        return agent
+
+    @cached_property
+    def requirements_analyzer(self) -> Agent:
+        """Create the Requirements Analyzer agent."""
+        return self._create_agent(REQUIREMENTS_ANALYST, self.llm_heavy)
+
+    @cached_property
+    def non_functional_requirements_analyzer(self) -> Agent:
+        """Create a second Requirements Analyzer for the concurrent NFR analysis task."""
+        return self._create_agent(REQUIREMENTS_ANALYST, self.llm_heavy)
 
-    def create_test_case_generator(self) -> Agent:
+    @cached_property
+    def test_case_generator(self) -> Agent:
         """Create the Test Case Generator agent."""
-        return Agent(
-            role='Test Case Engineer',
-            goal='Generate comprehensive test cases covering all requirement aspects',
-            backstory='''You are a senior Test Case Engineer specializing in creating 
-            detailed test cases for complex systems. Your test cases are known for their 
-            clarity, completeness, and attention to edge cases.''',
-            verbose=True,
-            llm=self.llm
-        )
+        return self._create_agent(TEST_CASE_ENGINEER, self.llm_heavy)
 
-    def create_test_data_generator(self) -> Agent:
+    @cached_property
+    def test_data_generator(self) -> Agent:
         """Create the Test Data Generator agent."""
-        return Agent(
-            role='Test Data Engineer',
-            goal='Generate comprehensive test data sets for all test scenarios',
-            backstory='''You are a specialized Test Data Engineer with expertise in creating 
-            realistic and comprehensive test data. You understand data patterns, boundary 
-            conditions, and security implications of test data.''',
-            verbose=True,
-            llm=self.llm
-        )
+        return self._create_agent(TEST_DATA_ENGINEER, self.llm_light)
 
-    def create_test_case_validator(self) -> Agent:
+    @cached_property
+    def test_case_validator(self) -> Agent:
         """Create the Test Case Validator agent."""
-        return Agent(
-            role='Test Case Validator',
-            goal='Validate and optimize test cases for completeness and effectiveness',
-            backstory='''You are a Test Case Validation expert who ensures test cases meet 
-            quality standards and provide optimal coverage. You excel at identifying gaps 
-            and optimizing test suites.''',
-            verbose=True,
-            llm=self.llm
+        return self._create_agent(TEST_CASE_VALIDATOR, self.llm_light)
+
+    def _is_large_document(self) -> bool:
+        """Whether the requirements need map-reduce analysis."""
+        return len(self.requirements_text) > ANALYSIS_CHUNK_SIZE
+
+    def _analysis_input(self) -> str:
+        """Source material for the analysis tasks: the document or its chunk analyses."""
+        if self.chunk_analyses is None:
+            return f"Requirements document:\n{DOCUMENT_OPEN}\n{self.requirements_text}\n{DOCUMENT_CLOSE}"
+        partials = "\n\n".join(
+            f"--- Chunk {index + 1} ---\n{analysis}"
+            for index, analysis in enumerate(self.chunk_analyses)
+        )
+        return (
+            "Partial analyses of consecutive document chunks (merge, drop duplicates):\n"
+            f"{DOCUMENT_OPEN}\n{partials}\n{DOCUMENT_CLOSE}"
         )
 
-    def analyze_requirements_task(self) -> Task:
-        """Create the requirements analysis task."""
-        output_file = os.path.join(self.output_dir, 'requirements_analysis.md')
+    def analyze_requirements_chunk_task(self, chunk: str, index: int) -> Task:
+        """Create the analysis task for one chunk of a large document."""
+        from crewai import Task
+        output_file = os.path.join(self.staging_dir, f'requirements_chunk_{index + 1}_analysis.md')
         return Task(
-            description=f"""Thoroughly analyze the following software requirements document:
-            {self.requirements_text}
-
-            Extract and structure:
-            1. Functional Requirements
-            2. Non-functional Requirements
-            3. Business Rules and Constraints
-            4. User Scenarios and Workflows
-            5. System Interfaces and Dependencies
-            6. Performance Requirements
-            7. Security Requirements
-            8. Edge Cases and Boundary Conditions
-
-            Provide a detailed, structured analysis suitable for test case creation.""",
-            agent=self.create_requirements_analyzer(),
+            description=ANALYZE_CHUNK_TEMPLATE.format(number=index + 1, chunk=chunk),
+            expected_output='Markdown analysis of the chunk, one section per extracted item',
+            # Chunk crews run concurrently, so each gets its own agent
+            agent=self._create_agent(REQUIREMENTS_ANALYST, self.llm_heavy),
+            output_file=output_file
+        )
+
+    def _create_chunk_tasks(self) -> List[Task]:
+        """Split the document and create one analysis task per chunk."""
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=ANALYSIS_CHUNK_SIZE,
+            chunk_overlap=ANALYSIS_CHUNK_OVERLAP
+        )
+        chunks = splitter.split_text(self.requirements_text)
+        logging.info(f"Analyzing requirements in {len(chunks)} chunks")
+        return [self.analyze_requirements_chunk_task(chunk, index) for index, chunk in enumerate(chunks)]
+
+    async def _analyze_chunks(self) -> None:
+        """Map phase: analyze document chunks concurrently for the merge tasks."""
+        from crewai import Crew
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+
+        async def analyze(task: Task) -> str:
+            async with semaphore:
+                crew = Crew(agents=[task.agent], tasks=[task], verbose=VERBOSE)
+                return str(await crew.kickoff_async())
+
+        self.chunk_analyses = list(await asyncio.gather(
+            *(analyze(task) for task in self._create_chunk_tasks())
+        ))
+
+    def analyze_functional_requirements_task(self) -> Task:
+        """Create the functional requirements analysis task."""
+        from crewai import Task
+        output_file = os.path.join(self.staging_dir, 'functional_requirements_analysis.md')
+        return Task(
+            description=ANALYZE_FUNCTIONAL_TEMPLATE.format(analysis_input=self._analysis_input()),
+            expected_output='Markdown analysis of the functional requirements',
+            agent=self.requirements_analyzer,
+            async_execution=True,
+            output_file=output_file
+        )
+
+    def analyze_non_functional_requirements_task(self) -> Task:
+        """Create the non-functional requirements analysis task."""
+        from crewai import Task
+        output_file = os.path.join(self.staging_dir, 'non_functional_requirements_analysis.md')
+        return Task(
+            description=ANALYZE_NON_FUNCTIONAL_TEMPLATE.format(analysis_input=self._analysis_input()),
+            expected_output='Markdown analysis of the non-functional requirements',
+            # Runs concurrently with the functional task, so it needs its own agent
+            agent=self.non_functional_requirements_analyzer,
+            async_execution=True,
             output_file=output_file
         )
 
     def generate_test_cases_task(self) -> Task:
         """Create the test case generation task."""
-        output_file = os.path.join(self.output_dir, 'detailed_test_cases.md')
+        from crewai import Task
+        output_file = os.path.join(self.staging_dir, 'detailed_test_cases.md')
         return Task(
-            description="""Generate comprehensive test cases based on the requirements analysis.
-            
-            Include test cases for:
-            1. Functional Requirements
-            2. Non-functional Requirements
-            3. Edge Cases and Boundary Conditions
-            4. Error Scenarios
-            5. Integration Points
-            6. Security Scenarios
-            7. Performance Testing
-
-            Each test case must include:
-            - Unique ID and Title
-            - Requirement Reference
-            - Preconditions
-            - Test Steps
-            - Expected Results
-            - Test Data References
-            - Priority and Type
-            - Notes and Risks""",
-            agent=self.create_test_case_generator(),
-            dependencies=[os.path.join(self.output_dir, 'requirements_analysis.md')],
+            description=GENERATE_TEST_CASES_PROMPT,
+            expected_output='Markdown list of test cases with every listed field',
+            agent=self.test_case_generator,
+            dependencies=[
+                os.path.join(self.staging_dir, 'functional_requirements_analysis.md'),
+                os.path.join(self.staging_dir, 'non_functional_requirements_analysis.md')
+            ],
             output_file=output_file
         )
 
     def generate_test_data_task(self) -> Task:
         """Create the test data generation task."""
-        output_file = os.path.join(self.output_dir, 'test_data_sets.json')
+        from crewai import Task
+        output_file = os.path.join(self.staging_dir, 'test_data_sets.json')
         return Task(
-            description="""Generate comprehensive test data sets for all test cases.
-            
-            Include data for:
-            1. Happy Path Scenarios
-            2. Boundary Values
-            3. Invalid Inputs
-            4. Edge Cases
-            5. Security Testing
-            6. Performance Testing
-
-            Provide data sets in structured JSON format with:
-            - Test Case ID Reference
-            - Input Data Sets
-            - Expected Results
-            - Data Dependencies
-            - Environmental Requirements""",
-            agent=self.create_test_data_generator(),
-            dependencies=[os.path.join(self.output_dir, 'detailed_test_cases.md')],
+            description=GENERATE_TEST_DATA_PROMPT,
+            expected_output='JSON list of test data entries',
+            agent=self.test_data_generator,
+            dependencies=[os.path.join(self.staging_dir, 'detailed_test_cases.md')],
             output_file=output_file
         )
 
     def validate_test_cases_task(self) -> Task:
         """Create the test case validation task."""
-        output_file = os.path.join(self.output_dir, 'validation_report.md')
+        from crewai import Task
+        output_file = os.path.join(self.staging_dir, 'validation_report.md')
         return Task(
-            description="""Validate and optimize the test suite.
-            
-            Perform:
-            1. Requirements Coverage Analysis
-            2. Test Case Quality Assessment
-            3. Test Suite Optimization
-            4. Risk Analysis
-            
-            Provide detailed report including:
-            - Coverage Metrics
-            - Quality Metrics
-            - Optimization Recommendations
-            - Risk Assessment
-            - Improvement Suggestions""",
-            agent=self.create_test_case_validator(),
+            description=VALIDATE_TEST_CASES_PROMPT,
+            expected_output='Markdown validation report',
+            agent=self.test_case_validator,
             dependencies=[
-                os.path.join(self.output_dir, 'detailed_test_cases.md'),
-                os.path.join(self.output_dir, 'test_data_sets.json')
+                os.path.join(self.staging_dir, 'detailed_test_cases.md'),
+                os.path.join(self.staging_dir, 'test_data_sets.json')
             ],
             output_file=output_file
         )
 
-    def generate_test_cases(self) -> Dict[str, Any]:
-        """Execute the complete test case generation workflow."""
+    def _create_tasks(self) -> List[Task]:
+        """Create the workflow tasks in execution order."""
+        return [
+            self.analyze_functional_requirements_task(),
+            self.analyze_non_functional_requirements_task(),
+            self.generate_test_cases_task(),
+            self.generate_test_data_task(),
+            self.validate_test_cases_task()
+        ]
+
+    def _create_crew(self, tasks: Optional[List[Task]] = None) -> Crew:
+        """Assemble the crew; the two analysis tasks run concurrently."""
+        from crewai import Crew
+        if tasks is None:
+            tasks = self._create_tasks()
+
+        # Create agents
+        agents = [
+            self.requirements_analyzer,
+            self.non_functional_requirements_analyzer,
+            self.test_case_generator,
+            self.test_data_generator,
+            self.test_case_validator
+        ]
+
+        return Crew(
+            agents=agents,
+            tasks=tasks,
+            verbose=VERBOSE
+        )
+
+    def _restore_task_output(self, task: Task) -> bool:
+        """Rebuild a task's output from its staged file; False if it never finished."""
+        from crewai.tasks.task_output import TaskOutput
+        if not os.path.exists(task.output_file):
+            return False
+        with open(task.output_file) as f:
+            task.output = TaskOutput(
+                description=task.description,
+                raw=f.read(),
+                agent=task.agent.role if task.agent else ''
+            )
+        return True
+
+    def _run_crew(self, crew: Crew) -> Any:
+        """Run the crew; after a failure, resume with the tasks that did not finish.
+
+        Finished tasks are recognised by their staged output files, which are
+        loaded back as task outputs so the resumed tasks get the same context
+        the original run would have passed them. If every attempt fails, the
+        original error is raised.
+        """
         try:
-            logging.info("Starting test case generation workflow")
-            
-            # Create tasks
-            tasks = [
-                self.analyze_requirements_task(),
-                self.generate_test_cases_task(),
-                self.generate_test_data_task(),
-                self.validate_test_cases_task()
+            return crew.kickoff()
+        except Exception as e:
+            original_error = e
+
+        waves = self._task_waves(crew.tasks)
+        for attempt in range(1, CREW_REPLAY_ATTEMPTS + 1):
+            remaining = []
+            for wave_number, wave in enumerate(waves):
+                for task in wave:
+                    if self._restore_task_output(task):
+                        continue
+                    # Newer CrewAI marks an unset context with a truthy sentinel, not None
+                    if wave_number and not isinstance(task.context, list):
+                        # What the crew would have passed on: the previous wave's outputs
+                        task.context = waves[wave_number - 1]
+                    remaining.append(task)
+            if not remaining:
+                return crew.tasks[-1].output
+
+            logging.warning(
+                f"Crew run failed ({str(original_error)}); resuming {len(remaining)} "
+                f"of {len(crew.tasks)} tasks (attempt {attempt})"
+            )
+            try:
+                return self._create_crew(remaining).kickoff()
+            except Exception as e:
+                logging.warning(f"Resumed crew run failed: {str(e)}")
+
+        raise original_error
+
+    def _task_waves(self, tasks: List[Task]) -> List[List[Task]]:
+        """Group tasks into dependency waves: consecutive async tasks share a wave."""
+        waves: List[List[Task]] = []
+        for task in tasks:
+            if task.async_execution and waves and all(t.async_execution for t in waves[-1]):
+                waves[-1].append(task)
+            else:
+                waves.append([task])
+        return waves
+
+    def _batch_request(self, custom_id: str, task: Task, context: str) -> Dict[str, Any]:
+        """Render a task the way CrewAI would prompt it, as a Batch API request line."""
+        agent = task.agent
+        llm = agent.llm
+        system_prompt = f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
+        user_prompt = task.description
+        if context:
+            user_prompt += f"\n\nContext from previous tasks:\n{context}"
+        return {
+            'custom_id': custom_id,
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': {
+                'model': getattr(llm, 'model_name', None) or llm.model,
+                'temperature': LLM_TEMPERATURE,
+                'messages': [
+                    {'role': 'system', 'content': system_prompt},
+                    {'role': 'user', 'content': user_prompt}
+                ]
+            }
+        }
+
+    def _submit_batch(self, client: openai.OpenAI, requests: List[Dict[str, Any]], wave: str) -> Dict[str, str]:
+        """Submit one wave of requests to the Batch API and wait for the completions."""
+        input_file = os.path.join(self.staging_dir, f'batch_wave_{wave}.jsonl')
+        with open(input_file, 'wb') as f:
+            for request in requests:
+                f.write(orjson.dumps(request) + b"\n")
+
+        with open(input_file, 'rb') as f:
+            batch_file = client.files.create(file=f, purpose='batch')
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+        logging.info(f"Submitted batch {batch.id} (wave {wave}, {len(requests)} requests)")
+
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != 'completed':
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        completions = {}
+        if batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                record = orjson.loads(line)
+                response = record.get('response') or {}
+                if record.get('error') or response.get('status_code') != 200:
+                    raise RuntimeError(f"Batch request {record['custom_id']} failed: {record.get('error') or response}")
+                completions[record['custom_id']] = response['body']['choices'][0]['message']['content']
+
+        # A completed batch can still have failed requests, reported only in its error file
+        missing = [request['custom_id'] for request in requests if request['custom_id'] not in completions]
+        if missing:
+            message = f"Batch {batch.id} returned no output for {', '.join(missing)}"
+            if batch.error_file_id:
+                errors = client.files.content(batch.error_file_id).text.splitlines()
+                message += f" (error file {batch.error_file_id}: {errors[0] if errors else 'empty'})"
+            raise RuntimeError(message)
+        return completions
+
+    def _run_batch_pipeline(self) -> str:
+        """Run the workflow through the OpenAI Batch API instead of crew.kickoff().
+
+        Each dependency wave is submitted as one batch; its completions are
+        written to the tasks' output files and passed on as context, mirroring
+        how the crew chains task outputs.
+        """
+        import openai
+        client = openai.OpenAI(api_key=OPENAI_API_KEY, http_client=_shared_http_client())
+        if self._is_large_document():
+            chunk_tasks = self._create_chunk_tasks()
+            requests = [
+                self._batch_request(f"chunk-{index}", task, "")
+                for index, task in enumerate(chunk_tasks)
             ]
+            completions = self._submit_batch(client, requests, 'chunks')
+            self.chunk_analyses = [completions[request['custom_id']] for request in requests]
 
-            # Create agents
-            agents = [
-                self.create_requirements_analyzer(),
-                self.create_test_case_generator(),
-                self.create_test_data_generator(),
-                self.create_test_case_validator()
+        tasks = self._create_tasks()
+        outputs: List[str] = []
+
+        for wave_number, wave in enumerate(self._task_waves(tasks)):
+            context = "\n\n".join(outputs)
+            requests = [
+                self._batch_request(f"task-{tasks.index(task)}", task, context)
+                for task in wave
             ]
+            completions = self._submit_batch(client, requests, str(wave_number))
 
-            # Create and execute crew
-            crew = Crew(
-                agents=agents,
-                tasks=tasks,
-                verbose=True
-            )
+            for task, request in zip(wave, requests):
+                output = completions[request['custom_id']]
+                with open(task.output_file, 'w') as f:
+                    f.write(output)
+                outputs.append(output)
+
+        # Like crew.kickoff(), the result is the final task's output
+        return outputs[-1]
+
+    def _collect_sections(self, result: Any) -> Dict[str, str]:
+        """Assemble the report sections from the staged task outputs."""
+        sections = {}
+        for section, file_names in RESULT_SECTIONS.items():
+            parts = []
+            for file_name in file_names:
+                path = os.path.join(self.staging_dir, file_name)
+                if os.path.exists(path):
+                    with open(path) as f:
+                        parts.append(f.read())
+            sections[section] = "\n\n".join(parts)
+        sections['final_output'] = str(result)
+        return sections
+
+    def _complete(self, result: Any) -> Dict[str, Any]:
+        """Export results and build the success payload."""
+        self.export_results(self._collect_sections(result))
+
+        logging.info("Test case generation workflow completed successfully")
+
+        return {
+            'status': 'success',
+            'result': result,
+            'artifacts_directory': self.output_dir
+        }
+
+    def generate_test_cases(self) -> Dict[str, Any]:
+        """Execute the complete test case generation workflow."""
+        try:
+            logging.info("Starting test case generation workflow")
+            self.staging_dir = self._create_staging_directory()
 
             # Execute workflow
-            result = crew.kickoff()
-            
-            # Export results
-            self.export_results(result)
-            
-            logging.info("Test case generation workflow completed successfully")
-            
+            if BATCH_MODE:
+                result = self._run_batch_pipeline()
+            else:
+                with self._streaming_to_word():
+                    if self._is_large_document():
+                        asyncio.run(self._analyze_chunks())
+                    result = self._run_crew(self._create_crew())
+
+            return self._complete(result)
+
+        except Exception as e:
+            logging.error(f"Error in test case generation: {str(e)}")
             return {
-                'status': 'success',
-                'result': result,
-                'artifacts_directory': self.output_dir
+                'status': 'error',
+                'error': str(e)
             }
-            
+
+        finally:
+            self._promote_artifacts()
+
+    async def generate_test_cases_async(self) -> Dict[str, Any]:
+        """Execute the workflow without blocking the event loop."""
+        try:
+            logging.info("Starting async test case generation workflow")
+            self.staging_dir = self._create_staging_directory()
+
+            # Execute workflow
+            if BATCH_MODE:
+                result = await asyncio.to_thread(self._run_batch_pipeline)
+            else:
+                with self._streaming_to_word():
+                    if self._is_large_document():
+                        await self._analyze_chunks()
+                    # kickoff_async() is also a thread around kickoff()
+                    result = await asyncio.to_thread(self._run_crew, self._create_crew())
+
+            return self._complete(result)
+
         except Exception as e:
             logging.error(f"Error in test case generation: {str(e)}")
             return {
@@ -244,7 +800,10 @@ class TestCaseGenerationCrew:
                 'error': str(e)
             }
 
-    def export_results(self, results: Any) -> None:
+        finally:
+            self._promote_artifacts()
+
+    def export_results(self, results: Dict[str, str]) -> None:
         """Export results to various formats."""
         try:
             # Export to Word
@@ -259,10 +818,11 @@ class TestCaseGenerationCrew:
             logging.error(f"Error exporting results: {str(e)}")
             raise
 
-    def export_to_word(self, results: Any) -> str:
+    def export_to_word(self, results: Dict[str, str]) -> str:
         """Export results to a Word document."""
+        from docx import Document
         doc = Document()
-        output_file = os.path.join(self.output_dir, 'Generated_Test_Cases.docx')
+        output_file = os.path.join(self.staging_dir, 'Generated_Test_Cases.docx')
 
         # Add title
         doc.add_heading('Test Case Generation Results', level=1)
@@ -286,39 +846,201 @@ class TestCaseGenerationCrew:
         doc.save(output_file)
         return output_file
 
-    def export_to_json(self, results: Any) -> str:
+    @contextmanager
+    def _streaming_to_word(self) -> Iterator[None]:
+        """Write streamed tokens to Word in the background while the crew runs."""
+        writer = threading.Thread(target=self.export_stream_to_word, daemon=True)
+        writer.start()
+        try:
+            yield
+        finally:
+            self.token_queue.put(_STREAM_END)
+            writer.join()
+
+    def _stream_paragraphs(self) -> Iterator[Tuple[Any, str]]:
+        """Yield (run_id, paragraph) pairs on newlines or every N tokens of a run."""
+        buffers: Dict[Any, List[str]] = {}
+        while True:
+            item = self.token_queue.get()
+            if item is _STREAM_END:
+                break
+            run_id, token = item
+            buffer = buffers.setdefault(run_id, [])
+            if token is None:
+                # The response is complete; flush what is left of it
+                if buffer:
+                    yield run_id, "".join(buffer)
+                del buffers[run_id]
+                continue
+            *complete, rest = token.split("\n")
+            for piece in complete:
+                buffer.append(piece)
+                yield run_id, "".join(buffer)
+                buffer.clear()
+            if rest:
+                buffer.append(rest)
+            if len(buffer) >= STREAM_PARAGRAPH_TOKENS:
+                yield run_id, "".join(buffer)
+                buffer.clear()
+        for run_id, buffer in buffers.items():
+            if buffer:
+                yield run_id, "".join(buffer)
+
+    def export_stream_to_word(self) -> str:
+        """Append streamed LLM output to a Word document as it arrives."""
+        from docx import Document
+        doc = Document()
+        output_file = os.path.join(self.staging_dir, 'Generated_Test_Cases_Live.docx')
+
+        doc.add_heading('Test Case Generation Transcript', level=1)
+        # One section per LLM response; each keeps an empty anchor paragraph
+        # at its end so concurrent responses grow in place
+        anchors: Dict[Any, Any] = {}
+        for run_id, paragraph in self._stream_paragraphs():
+            if not paragraph.strip():
+                continue
+            if run_id not in anchors:
+                doc.add_heading(f'Response {len(anchors) + 1}', level=2)
+                anchors[run_id] = doc.add_paragraph()
+            anchors[run_id].insert_paragraph_before(paragraph)
+
+        doc.save(output_file)
+        return output_file
+
+    def export_to_json(self, results: Dict[str, str]) -> str:
         """Export results to JSON format."""
-        output_file = os.path.join(self.output_dir, 'test_cases_complete.json')
+        output_file = os.path.join(self.staging_dir, 'test_cases_complete.json')
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=4)
+        # Serialize in memory, then write once
+        payload = orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(payload)
         
         return output_file
 
-def main(file_path: str) -> int:
-    """Main function to execute the test case generation workflow."""
+def _document_text(file_path: str) -> str:
+    """Join the paragraph text of a .docx file; the document dies with this frame."""
+    from docx import Document
+    buffer = io.StringIO()
+    for para in Document(file_path).paragraphs:
+        buffer.write(para.text)
+        buffer.write("\n")
+    return buffer.getvalue()
+
+def read_requirements(file_path: str) -> str:
+    """Read the paragraph text of a requirements .docx file."""
+    text = _document_text(file_path)
+
+    # Release the XML tree before the long-running LLM calls
+    gc.collect()
+
+    return text
+
+def _result_cache_path(requirements_content: str) -> str:
+    """Cache file for a document's pipeline result, keyed by content, models and prompts."""
+    key = hashlib.blake2b(
+        requirements_content.encode() + MODEL_VERSION.encode() + PROMPT_VERSION.encode(),
+        digest_size=16
+    ).hexdigest()
+    return os.path.join(RESULT_CACHE_DIR, f"{key}.json")
+
+def _store_cached_result(cache_path: str, result: Dict[str, Any]) -> None:
+    """Atomically write a pipeline result to the result cache."""
+    os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=RESULT_CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(orjson.dumps(result, default=str))
+    os.replace(tmp_path, cache_path)
+
+def _load_cached_result(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Return a cached pipeline result, or None if it is missing or its artifacts are gone."""
+    if not os.path.exists(cache_path):
+        return None
+    with open(cache_path, 'rb') as f:
+        result = orjson.loads(f.read())
+    if not os.path.isdir(result.get('artifacts_directory') or ''):
+        # The artifacts were cleaned up; regenerate, which overwrites this entry
+        return None
+    result['cached'] = True
+    return result
+
+async def generate_batch_async(file_paths: List[str],
+                               max_concurrency: int = MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+    """Generate test cases for several documents concurrently over one HTTP pool."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def generate(file_path: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                # File I/O and the docx parse stay off the loop shared by every document
+                requirements_content = await asyncio.to_thread(read_requirements, file_path)
+                cache_path = _result_cache_path(requirements_content)
+                result = await asyncio.to_thread(_load_cached_result, cache_path)
+                if result is not None:
+                    logging.info(f"Using cached result for {file_path}")
+                else:
+                    crew = TestCaseGenerationCrew(requirements_content)
+                    result = await crew.generate_test_cases_async()
+                    if result['status'] == 'success':
+                        await asyncio.to_thread(_store_cached_result, cache_path, result)
+            except Exception as e:
+                logging.error(f"Error processing {file_path}: {str(e)}")
+                result = {'status': 'error', 'error': str(e)}
+            result['file_path'] = file_path
+            return result
+
+    return await asyncio.gather(*(generate(path) for path in file_paths))
+
+async def main_async(file_paths: List[str]) -> int:
+    """Main coroutine to execute the test case generation workflow."""
+    # Every running document holds a worker thread for its whole crew run (or
+    # batch poll), and its map phase needs up to ANALYSIS_CONCURRENCY more;
+    # the default pool (min(32, cpu_count + 4)) would cap documents well below
+    # MAX_CONCURRENCY. asyncio.run() shuts this executor down on exit.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=MAX_CONCURRENCY * ANALYSIS_CONCURRENCY,
+        thread_name_prefix='tcg'
+    ))
     try:
-        # Read the input document
-        doc = Document(file_path)
-        requirements_content = "\n".join([para.text for para in doc.paragraphs])
+        results = await generate_batch_async(file_paths)
+
+        # Print results; a single document keeps the original output shape
+        output = results[0] if len(results) == 1 else results
+        sys.stdout.buffer.write(orjson.dumps(output, default=str) + b"\n")
+        sys.stdout.flush()
+
+        return 0 if all(r['status'] == 'success' for r in results) else 1
 
-        # Initialize the crew
-        crew = TestCaseGenerationCrew(requirements_content)
-        
-        # Generate test cases
-        result = crew.generate_test_cases()
-        
-        # Print results
-        print(json.dumps(result))
-        
-        return 0 if result['status'] == 'success' else 1
-        
     except Exception as e:
-        print(json.dumps({'error': str(e)}), file=sys.stderr)
+        sys.stderr.buffer.write(orjson.dumps({'error': str(e)}) + b"\n")
         return 1
 
+def main(file_paths: List[str]) -> int:
+    """Main function to execute the test case generation workflow."""
+    return asyncio.run(main_async(file_paths))
+
+def parse_file_paths(args: List[str]) -> List[str]:
+    """Accept file paths as separate arguments or as a single JSON array.
+
+    Raises ValueError unless the result is a non-empty list of path strings.
+    """
+    if len(args) == 1 and args[0].lstrip().startswith('['):
+        try:
+            file_paths = orjson.loads(args[0])
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON array of file paths: {str(e)}") from e
+    else:
+        file_paths = args
+    if (not isinstance(file_paths, list) or not file_paths
+            or not all(isinstance(path, str) and path for path in file_paths)):
+        raise ValueError("Expected one or more requirements file paths")
+    return file_paths
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python test_case_generator.py <requirements_file_path>")
+    try:
+        file_paths = parse_file_paths(sys.argv[1:])
+    except ValueError as e:
+        print(str(e))
+        print("Usage: python test_case_generator.py <requirements_file_path> [<requirements_file_path> ...]")
         sys.exit(1)
-    sys.exit(main(sys.argv[1]))
\ No newline at end of file
+    sys.exit(main(file_paths))
@@ -0,0 +1,238 @@
+import importlib
+import os
+import queue
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class FakeCrew:
+    """Stands in for a Crew: writes each task's output file unless the task is set to fail."""
+
+    def __init__(self, tasks, failures, kickoffs):
+        self.tasks = tasks
+        self.failures = failures
+        self.kickoffs = kickoffs
+
+    def kickoff(self):
+        self.kickoffs.append([(task, task.context) for task in self.tasks])
+        for task in self.tasks:
+            error, times = self.failures.get(task.description, (None, 0))
+            if times:
+                self.failures[task.description] = (error, times - 1)
+                raise error
+            with open(task.output_file, "w") as f:
+                f.write(f"output of {task.description}")
+            task.output = f"output of {task.description}"
+        return self.tasks[-1].output
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.syspath_prepend(SERVER_DIR)
+    sys.modules.pop("testcase_generator", None)
+    return importlib.import_module("testcase_generator")
+
+
+@pytest.fixture
+def task_class():
+    # Only the crew tests need CrewAI; the helper tests run without it
+    return pytest.importorskip("crewai").Task
+
+
+@pytest.fixture
+def crew(generator, task_class, monkeypatch):
+    crew = generator.TestCaseGenerationCrew("The user can log in.")
+    crew.staging_dir = crew._create_staging_directory()
+    # Same shape as the real workflow: two concurrent analyses, then three sequential tasks
+    crew.tasks = [
+        task_class(
+            description=f"task {index}",
+            expected_output="text",
+            async_execution=index < 2,
+            # Explicit, so the test does not depend on CrewAI's default for unset context
+            context=None,
+            output_file=os.path.join(crew.staging_dir, f"task_{index}.md"),
+        )
+        for index in range(5)
+    ]
+    crew.failures = {}
+    crew.kickoffs = []
+    monkeypatch.setattr(
+        crew, "_create_crew",
+        lambda tasks=None: FakeCrew(tasks or crew.tasks, crew.failures, crew.kickoffs)
+    )
+    return crew
+
+
+def run(crew, failing_task, times):
+    crew.failures[f"task {failing_task}"] = (RateLimitError("429 Too Many Requests"), times)
+    return crew._run_crew(crew._create_crew())
+
+
+def test_resumes_from_the_failed_sequential_task(crew):
+    tasks = crew.tasks
+    result = run(crew, failing_task=3, times=1)
+
+    assert result == "output of task 4"
+    resumed = crew.kickoffs[-1]
+    assert [task for task, _ in resumed] == tasks[3:]
+    assert resumed[0][1] == [tasks[2]]
+    assert resumed[1][1] == [tasks[3]]
+    # Finished tasks are rebuilt from their staged files
+    assert tasks[2].output.raw == "output of task 2"
+
+
+def test_resumes_inside_the_concurrent_analysis_wave(crew):
+    tasks = crew.tasks
+    run(crew, failing_task=1, times=1)
+
+    resumed = dict(crew.kickoffs[-1])
+    assert list(resumed) == tasks[1:]
+    assert resumed[tasks[1]] is None
+    assert resumed[tasks[2]] == tasks[:2]
+    assert tasks[0].output.raw == "output of task 0"
+
+
+def test_reraises_the_original_error(generator, crew):
+    attempts = 1 + generator.CREW_REPLAY_ATTEMPTS
+    with pytest.raises(RateLimitError) as excinfo:
+        run(crew, failing_task=3, times=attempts)
+
+    assert excinfo.value is crew.failures["task 3"][0]
+    assert len(crew.kickoffs) == attempts
+
+
+def test_resumed_task_with_crewai_default_context_gets_previous_wave(crew, task_class):
+    tasks = crew.tasks
+    # No context argument: whatever this CrewAI uses for "unset" must count as unset
+    tasks[3] = task_class(
+        description="task 3",
+        expected_output="text",
+        output_file=os.path.join(crew.staging_dir, "task_3.md"),
+    )
+    run(crew, failing_task=3, times=1)
+
+    assert crew.kickoffs[-1][0] == (tasks[3], [tasks[2]])
+
+
+def prompt_with_document(instructions, document, generator):
+    return f"{instructions}\n{generator.DOCUMENT_OPEN}\n{document}\n{generator.DOCUMENT_CLOSE}"
+
+
+def test_semantic_cache_key_embeds_only_the_document(generator):
+    first = generator._semantic_cache_key(
+        {"prompt": prompt_with_document("Analyze.", "The user can log in.", generator)}
+    )
+    near_duplicate = generator._semantic_cache_key(
+        {"prompt": prompt_with_document("Analyze.", "A user can log in.", generator)}
+    )
+    other_task = generator._semantic_cache_key(
+        {"prompt": prompt_with_document("Summarize.", "The user can log in.", generator)}
+    )
+
+    assert first == (near_duplicate[0], "The user can log in.")
+    assert near_duplicate[1] == "A user can log in."
+    # Different instructions never share a digest, however similar the document
+    assert other_task[0] != first[0]
+
+
+def test_semantic_cache_key_without_markers_matches_exactly(generator):
+    digest, text = generator._semantic_cache_key({"prompt": "Write test cases."})
+
+    assert digest != generator._semantic_cache_key({"prompt": "Write test data."})[0]
+    assert text == "Write test cases."
+
+
+def test_semantic_cache_key_folds_long_documents_into_the_digest(generator):
+    document = "x" * generator.SEMANTIC_CACHE_MAX_CHARS
+    at_limit = generator._semantic_cache_key({"prompt": prompt_with_document("Analyze.", document, generator)})
+    edited = generator._semantic_cache_key({"prompt": prompt_with_document("Analyze.", "y" + document[1:], generator)})
+    too_long = generator._semantic_cache_key({"prompt": prompt_with_document("Analyze.", document + "x", generator)})
+    too_long_edited = generator._semantic_cache_key(
+        {"prompt": prompt_with_document("Analyze.", "y" + document, generator)}
+    )
+
+    assert at_limit[0] == edited[0]
+    assert too_long[0] != too_long_edited[0]
+    assert len(too_long[1]) == generator.SEMANTIC_CACHE_MAX_CHARS
+
+
+def test_full_size_chunk_prompt_stays_semantic(generator):
+    chunk = "x" * generator.SEMANTIC_CACHE_MAX_CHARS
+    prompt = generator.ANALYZE_CHUNK_TEMPLATE.format(number=1, chunk=chunk)
+    edited = generator.ANALYZE_CHUNK_TEMPLATE.format(number=1, chunk="y" + chunk[1:])
+
+    assert generator._semantic_cache_key({"prompt": prompt})[0] == generator._semantic_cache_key({"prompt": edited})[0]
+
+
+class FixedEvaluation:
+    def evaluation(self, src_dict, cache_dict, **kwargs):
+        return 0.9
+
+    def range(self):
+        return 0.0, 1.0
+
+
+def test_content_hash_evaluation_rejects_mismatched_digests(generator):
+    evaluation = generator._ContentHashEvaluation(FixedEvaluation())
+
+    assert evaluation.evaluation({"question": "a"}, {"question": "b"}) == evaluation.range()[0]
+    assert evaluation.evaluation({"question": "a"}, {"question": "a"}) == 0.9
+
+
+def test_parse_file_paths_accepts_arguments_or_a_json_array(generator):
+    assert generator.parse_file_paths(["a.docx", "b.docx"]) == ["a.docx", "b.docx"]
+    assert generator.parse_file_paths(['["a.docx", "b.docx"]']) == ["a.docx", "b.docx"]
+
+
+@pytest.mark.parametrize("args", [[], ["[]"], ["[1, 2]"], ['["a.docx", ""]'], ["[not json"], [""]])
+def test_parse_file_paths_rejects_empty_or_malformed_lists(generator, args):
+    with pytest.raises(ValueError):
+        generator.parse_file_paths(args)
+
+
+def stream(generator, items):
+    crew = object.__new__(generator.TestCaseGenerationCrew)
+    crew.token_queue = queue.Queue()
+    for item in items:
+        crew.token_queue.put(item)
+    crew.token_queue.put(generator._STREAM_END)
+    return list(crew._stream_paragraphs())
+
+
+def test_stream_paragraphs_keeps_interleaved_runs_apart(generator):
+    paragraphs = stream(generator, [
+        ("a", "Hello "), ("a", "wor"), ("b", "Other\n"), ("a", "ld\nnext"), ("a", None), ("b", None)
+    ])
+
+    assert paragraphs == [("b", "Other"), ("a", "Hello world"), ("a", "next")]
+
+
+def test_stream_paragraphs_splits_long_lines_by_token_count(generator, monkeypatch):
+    monkeypatch.setattr(generator, "STREAM_PARAGRAPH_TOKENS", 3)
+
+    assert stream(generator, [("a", token) for token in "abcd"]) == [("a", "abc"), ("a", "d")]
+
+
+def test_load_cached_result_requires_the_artifacts_directory(generator, tmp_path):
+    cache_path = generator._result_cache_path("The user can log in.")
+    assert generator._load_cached_result(cache_path) is None
+
+    artifacts = tmp_path / "test_artifacts_1"
+    artifacts.mkdir()
+    generator._store_cached_result(cache_path, {"status": "success", "artifacts_directory": str(artifacts)})
+    assert generator._load_cached_result(cache_path) == {
+        "status": "success", "artifacts_directory": str(artifacts), "cached": True
+    }
+
+    artifacts.rmdir()
+    assert generator._load_cached_result(cache_path) is None